@@ -1,7 +1,7 @@
 from fastapi import FastAPI, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from sqlalchemy import create_engine, MetaData, Table, select
+from fastapi.responses import FileResponse, Response
+from sqlalchemy import create_engine, MetaData, Table, and_, inspect, select
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -36,6 +36,18 @@ def calculate_distance(lat1, lon1, lat2, lon2):
     return R * c * 1000  # meters
 
 
+async def get_thumbnails_table():
+    """Returns the thumbnails table, or None until the video ingest has created it."""
+    if "thumbnails" not in metadata.tables:
+        def reflect_thumbnails(sync_conn):
+            if inspect(sync_conn).has_table("thumbnails"):
+                metadata.reflect(sync_conn, only=["thumbnails"])
+
+        async with engine.connect() as conn:
+            await conn.run_sync(reflect_thumbnails)
+    return metadata.tables.get("thumbnails")
+
+
 @app.on_event("startup")
 async def startup():
     async with engine.begin() as conn:
@@ -123,9 +135,25 @@ async def get_video_and_coordinates(video_id: int):
         if not os.path.exists(video_path):
             raise HTTPException(status_code=404, detail="Video file not found on disk")
 
-        frames_stmt = select(frames).where(frames.c.video_id == video_id).order_by(frames.c.frame_number)
+        # Attach each frame's thumbnail version so clients can build cacheable preview URLs
+        thumbnails = await get_thumbnails_table()
+        if thumbnails is not None:
+            frames_stmt = select(frames, thumbnails.c.version.label("thumbnail_version")).select_from(
+                frames.outerjoin(
+                    thumbnails,
+                    and_(
+                        thumbnails.c.video_id == frames.c.video_id,
+                        thumbnails.c.frame_number == frames.c.frame_number,
+                    ),
+                )
+            )
+        else:
+            frames_stmt = select(frames)
+        frames_stmt = frames_stmt.where(frames.c.video_id == video_id).order_by(frames.c.frame_number)
         frame_result = await session.execute(frames_stmt)
         frame_data = [dict(row._mapping) for row in frame_result.fetchall()]
+        for frame in frame_data:
+            frame.setdefault("thumbnail_version", None)
 
         return {"video_path": video_path, "coordinates": frame_data}
 
@@ -147,4 +175,40 @@ async def download_video_file(video_id: int):
         if not os.path.exists(video_path):
             raise HTTPException(status_code=404, detail="File does not exist on disk")
 
-        return FileResponse(video_path, media_type="video/mp4", filename=os.path.basename(video_path))
\ No newline at end of file
+        return FileResponse(video_path, media_type="video/mp4", filename=os.path.basename(video_path))
+
+
+@app.get("/videos/{video_id}/thumbnails/{frame_number}")
+async def get_frame_thumbnail(
+    video_id: int,
+    frame_number: int,
+    v: str | None = Query(None, description="Thumbnail version from the /videos/{video_id} coordinates"),
+):
+    """Serves the JPEG preview captured at ingest time for a sampled frame."""
+    thumbnails = await get_thumbnails_table()
+    if thumbnails is None:
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
+
+    async with async_session() as session:
+        stmt = select(thumbnails.c.image, thumbnails.c.version).where(
+            thumbnails.c.video_id == video_id,
+            thumbnails.c.frame_number == frame_number,
+        )
+        result = await session.execute(stmt)
+        row = result.fetchone()
+
+        if not row:
+            raise HTTPException(status_code=404, detail="Thumbnail not found")
+
+        # A URL carrying the current version always maps to these exact bytes, so it
+        # can be cached for good; re-ingesting changes the version and thus the URL
+        if v is not None and v == row.version:
+            cache_control = "public, max-age=31536000, immutable"
+        else:
+            cache_control = "public, no-cache"
+
+        return Response(
+            content=row.image,
+            media_type="image/jpeg",
+            headers={"Cache-Control": cache_control, "ETag": f'"{row.version}"'},
+        )
@@ -1,4 +1,5 @@
 import cv2
+import hashlib
 import pytesseract
 import re
 import platform
@@ -37,6 +38,19 @@ cursor.execute('''
     )
 ''')
 
+# Small JPEG previews of the sampled frames, so the map can show a frame
+# without fetching the whole video
+cursor.execute('''
+    CREATE TABLE IF NOT EXISTS thumbnails (
+        video_id INTEGER,
+        frame_number INTEGER,
+        image BLOB,
+        version TEXT,
+        PRIMARY KEY(video_id, frame_number),
+        FOREIGN KEY(video_id) REFERENCES videos(id)
+    )
+''')
+
 # Insert video entry if not present
 cursor.execute("SELECT id FROM videos WHERE filename = ?", (video_filename,))
 row = cursor.fetchone()
@@ -53,6 +67,8 @@ else:
 cap = cv2.VideoCapture(video_path)
 frame_number = 0
 frame_interval = 100  # Skip every 15 frames
+thumbnail_width = 160  # Downscaled preview width in pixels
+thumbnail_quality = 70  # JPEG quality for previews
 
 def extract_lat_lng(text):
     lat_match = re.search(r'Lat:\s*([0-9.+-]+)', text)
@@ -61,6 +77,13 @@ def extract_lat_lng(text):
         return float(lat_match.group(1)), float(lon_match.group(1))
     return None, None
 
+def encode_thumbnail(frame):
+    height, width = frame.shape[:2]
+    scale = min(1.0, thumbnail_width / width)  # Never upscale small sources
+    small = cv2.resize(frame, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
+    ok, buffer = cv2.imencode('.jpg', small, [cv2.IMWRITE_JPEG_QUALITY, thumbnail_quality])
+    return buffer.tobytes() if ok else None
+
 # Process video frames
 while cap.isOpened():
     ret, frame = cap.read()
@@ -83,6 +106,14 @@ while cap.isOpened():
             "INSERT INTO frames (video_id, frame_number, latitude, longitude) VALUES (?, ?, ?, ?)",
             (video_id, frame_number, lat, lon)
         )
+        thumbnail = encode_thumbnail(frame)
+        if thumbnail is not None:
+            # Keep one preview per frame; the version changes whenever the image
+            # does, so clients caching the versioned URL never see a stale one
+            cursor.execute(
+                "INSERT OR REPLACE INTO thumbnails (video_id, frame_number, image, version) VALUES (?, ?, ?, ?)",
+                (video_id, frame_number, thumbnail, hashlib.sha1(thumbnail).hexdigest())
+            )
         conn.commit()
 
 cap.release()
@@ -115,6 +115,7 @@ export interface FrameData {
   latitude: number;
   longitude: number;
   timestamp?: string;
+  thumbnail_version?: string | null;
 }
 
 export interface VideoWithCoordinates {